@@ -1,177 +1,55 @@
-import streamlit as st
-import matplotlib.pyplot as plt
+import altair as alt
 import numpy as np
-import matplotlib.ticker as mticker
+import pandas as pd
+import streamlit as st
+
+import simulations
 
 # ---------------------------------------------------------------------
 # Simulation Functions
 # ---------------------------------------------------------------------
-def simulate_buy_scenario(initial_savings, monthly_income, monthly_expenses,
-                          annual_income_growth, annual_inflation_rate, annual_invest_return,
-                          property_price, mortgage_term_years, mortgage_interest_rate, deposit_fraction,
-                          owner_cost_initial, annual_owner_cost_inflation, annual_house_price_growth,
-                          max_months=480):
-    """
-    Scenario 1: Buy a property now using a mortgage.
-    
-    Simulation Mechanics:
-    1. At time zero, you pay the deposit and finance the remaining amount with a mortgage.
-    2. Every month:
-       - Update income, expenses, and owner costs using growth/inflation rates.
-       - The property price grows using the annual house price growth.
-       - Pay monthly mortgage interest and owner costs.
-       - Add any positive disposable income to your investment portfolio (which grows at the monthly investment rate).
-    3. Homeownership is deemed achieved when the investment portfolio meets or exceeds the outstanding mortgage.
-    
-    Additionally, this function tracks the cumulative amount spent on housing:
-      - For buying: deposit + interest payments + owner occupier housing costs.
-    
-    Returns:
-    - stop_month: First month when homeownership is achieved (or None)
-    - final_investment_portfolio: Final investment portfolio value.
-    - history: Dictionary with monthly history: "months", "house_price", "investment_portfolio", 
-               "net_wealth", and "cumulative_spent".
-    """
-    # Monthly multipliers
-    mi_growth = (1 + annual_income_growth) ** (1 / 12)
-    me_growth = (1 + annual_inflation_rate) ** (1 / 12)
-    mi_return = (1 + annual_invest_return) ** (1 / 12)
-    m_interest = mortgage_interest_rate / 12
-    moc_growth = (1 + annual_owner_cost_inflation) ** (1 / 12)
-    mhp_growth = (1 + annual_house_price_growth) ** (1 / 12)
-    
-    # Initial conditions
-    deposit_amount = deposit_fraction * property_price
-    if initial_savings < deposit_amount:
-        st.error("For the buying scenario, initial savings are less than the required deposit.")
-        return None, None, None
-
-    # Investment portfolio starts after paying the deposit.
-    investment_portfolio = initial_savings - deposit_amount
-    outstanding_mortgage = property_price * (1 - deposit_fraction)
-    
-    current_income = monthly_income
-    current_expenses = monthly_expenses
-    current_owner_cost = owner_cost_initial
-    current_house_price = property_price
-    
-    # Cumulative spent starts with the deposit.
-    cumulative_spent = deposit_amount
-    
-    # History tracking
-    history = {
-        "months": [],
-        "house_price": [],
-        "investment_portfolio": [],
-        "net_wealth": [],
-        "cumulative_spent": []
-    }
-    stop_month = None
-    
-    for month in range(max_months):
-        net_wealth = (current_house_price - outstanding_mortgage) + investment_portfolio
-        history["months"].append(month)
-        history["house_price"].append(current_house_price)
-        history["investment_portfolio"].append(investment_portfolio)
-        history["net_wealth"].append(net_wealth)
-        history["cumulative_spent"].append(cumulative_spent)
-        
-        # Check homeownership condition
-        if stop_month is None and investment_portfolio >= outstanding_mortgage:
-            stop_month = month
-        
-        interest_payment = outstanding_mortgage * m_interest
-        monthly_disposable = current_income - current_expenses - interest_payment - current_owner_cost
-        if monthly_disposable < 0:
-            monthly_disposable = 0
-        
-        # Add monthly cost (interest and owner cost) to cumulative spent
-        cumulative_spent += interest_payment + current_owner_cost
-        
-        # Update investment portfolio and monthly variables
-        investment_portfolio = investment_portfolio * mi_return + monthly_disposable
-        current_income *= mi_growth
-        current_expenses *= me_growth
-        current_owner_cost *= moc_growth
-        current_house_price *= mhp_growth
-        
-    return stop_month, investment_portfolio, history
-
-def simulate_rent_scenario(initial_savings, monthly_income, monthly_expenses,
-                           annual_income_growth, annual_inflation_rate, annual_invest_return,
-                           property_price, monthly_rent, annual_rent_inflation_rate, annual_house_price_growth,
-                           max_months=480):
-    """
-    Scenario 2: Rent now and purchase for cash later.
-    
-    Simulation Mechanics:
-    1. All initial savings are invested.
-    2. Every month:
-         - Update income, expenses, and rent using their respective growth/inflation multipliers.
-         - The property price grows according to the annual house price growth.
-         - Add any positive disposable income to your investment portfolio.
-    3. Homeownership is met when the investment portfolio reaches or exceeds the current property price.
-    
-    Additionally, this function tracks the cumulative amount spent on rent.
-    
-    Returns:
-    - stop_month: The first month when homeownership is achieved (or None)
-    - final_investment_portfolio: Final value of the investment portfolio.
-    - history: Dictionary with monthly history: "months", "house_price", "investment_portfolio", 
-               and "cumulative_spent".
-    """
-    # Monthly multipliers
-    mi_growth = (1 + annual_income_growth) ** (1 / 12)
-    me_growth = (1 + annual_inflation_rate) ** (1 / 12)
-    mi_return = (1 + annual_invest_return) ** (1 / 12)
-    mr_growth = (1 + annual_rent_inflation_rate) ** (1 / 12)
-    mhp_growth = (1 + annual_house_price_growth) ** (1 / 12)
-    
-    investment_portfolio = initial_savings
-    current_income = monthly_income
-    current_expenses = monthly_expenses
-    current_rent = monthly_rent
-    current_house_price = property_price
-    
-    # Cumulative spent on rent.
-    cumulative_spent = 0
-    
-    history = {
-        "months": [],
-        "house_price": [],
-        "investment_portfolio": [],
-        "cumulative_spent": []
-    }
-    stop_month = None
-    
-    for month in range(max_months):
-        history["months"].append(month)
-        history["house_price"].append(current_house_price)
-        history["investment_portfolio"].append(investment_portfolio)
-        history["cumulative_spent"].append(cumulative_spent)
-        
-        if stop_month is None and investment_portfolio >= current_house_price:
-            stop_month = month
-        
-        monthly_disposable = current_income - current_expenses - current_rent
-        if monthly_disposable < 0:
-            monthly_disposable = 0
-        
-        cumulative_spent += current_rent
-        
-        investment_portfolio = investment_portfolio * mi_return + monthly_disposable
-        current_income *= mi_growth
-        current_expenses *= me_growth
-        current_rent *= mr_growth
-        current_house_price *= mhp_growth
-    
-    return stop_month, investment_portfolio, history
+# Results are cached on the inputs, so the caller must check that initial savings cover the deposit.
+simulate_both = st.cache_data(show_spinner=False, max_entries=128)(simulations.simulate_both)
+simulate_invest_return_bands = st.cache_data(show_spinner=False, max_entries=32)(simulations.simulate_invest_return_bands)
 
 def format_duration(months):
     years = months // 12
     remaining_months = months % 12
     return f"{years} years, {remaining_months} months"
 
+# ---------------------------------------------------------------------
+# Chart Template
+# ---------------------------------------------------------------------
+# Streamlit re-executes this script on every interaction, so the parts of the chart that do not depend
+# on the inputs are built in a st.cache_resource factory: once per process, shared by all sessions.
+# They are shared objects, so callers copy the colour mapping before adding their regions and bands.
+@st.cache_resource
+def chart_template():
+    series_colors = {
+        "Buy: Cumulative Spent": "green",
+        "Rent: Cumulative Spent": "red",
+        "House Price": "blue",
+        "Scenario 1: Equity + Investments": "green",
+        "Scenario 2: Investments": "red",
+    }
+    series_dashes = {
+        "Buy: Cumulative Spent": [6, 4],
+        "Rent: Cumulative Spent": [6, 4],
+        "House Price": [1, 0],
+        "Scenario 1: Equity + Investments": [1, 0],
+        "Scenario 2: Investments": [1, 0],
+    }
+    month_x = alt.X("Month:Q", title="Months", scale=alt.Scale(nice=False))
+    value_y = alt.Y("Value:Q", title="£", axis=alt.Axis(labelExpr="'£' + format(datum.value, ',.0f')"))
+    series_dash = alt.StrokeDash("Series:N", legend=None,
+                                 scale=alt.Scale(domain=list(series_dashes), range=list(series_dashes.values())))
+    series_tooltip = ["Month:Q", "Series:N", alt.Tooltip("Value:Q", format=",.0f")]
+    return series_colors, month_x, value_y, series_dash, series_tooltip
+
+# Only every third month is drawn, which is indistinguishable at screen size and cuts the data sent
+# to the browser. Results, the crossover and the markers still use every month.
+CHART_STRIDE = 3
+
 # ---------------------------------------------------------------------
 # Streamlit Interface
 # ---------------------------------------------------------------------
@@ -214,7 +92,7 @@ with tab_methodology:
     The objective is to determine the time required to achieve homeownership as well as the cumulative amount spent on each approach.
 
     ### Scenario 1: Buying with a Mortgage
-    - You immediately buy a property with a mortgage and invest any spare income
+    - You immediately buy a property with a repayment mortgage and invest any spare income
     - Once your investments grow to exceed the remaining mortgage balance, you pay off the mortgage in one go
     
     ### Scenario 2: Renting until cash Purchase
@@ -224,6 +102,8 @@ with tab_methodology:
     ### Assumptions
     - All spare income is invested
     - The interest rate of the mortgage stays fixed for the entire term
+    - The mortgage is repaid in equal monthly instalments over the term; only the interest part of each
+      instalment counts towards the amount spent, as the principal becomes equity
     - There are no penalties for early repayment
     - Moving & completion costs are not considered    
     
@@ -240,7 +120,7 @@ with tab_methodology:
     - House Price Growth Rate: How much the property increases in value each year in percentage terms.
     - Property Price: Price of the property you want to purchase. In scenario 1 this is the price you buy at immediately. 
                     In scenario 2 this price will grow and this is what you need to reach. 
-    - Mortgage Term: Years over which the mortgage runs
+    - Mortgage Term: Years over which the mortgage is repaid
     - Mortgage Interest Rate: Annual interest rate over the entire lifetime of the mortgage (assumed fixed)
     - Deposit: The amount you put down on the property in scenario 1 as a percentage of the property's price. Note this 
              must not be set in a way that makes it exceed your initial savings. 
@@ -249,6 +129,11 @@ with tab_methodology:
                                                 percentage terms.
     - Monthly Rent: How much you initially pay each month in rent in scenario 2
     - Annual Rent Inflation Rate: How much the Monthly Rent increases per year in percentage terms
+    - Investment Return Volatility: Optional stress test. When above zero, the simulation is repeated with the 
+                                  annual investment return drawn from a normal distribution around the Annual 
+                                  Investment Return Rate with this standard deviation, and the 5th-95th percentile 
+                                  range of each scenario's wealth is shaded on the chart.
+    - Number of Paths: How many investment returns are drawn for the stress test
     
     ### Instructions
     1. Fill in all the global inputs (refer to the Inputs & Definitions above for guidance)
@@ -260,7 +145,11 @@ with tab_methodology:
         - The crossover point at which the cumulative cost of buying is lower than renting
     """)
 
-with tab_simulation:
+# The simulation tab is a fragment, so its own widgets rerun only this function rather than the whole
+# script. Changing a sidebar input still reruns everything and passes in the new values.
+@st.fragment
+def simulation_tab(initial_savings, monthly_income, monthly_expenses,
+                   annual_income_growth, annual_inflation_rate, annual_invest_return, annual_house_price_growth):
     st.header("Scenario 1: Buying with a Mortgage")
     property_price = st.number_input("Property Price (£)", value=430000.0, step=10000.0)
     mortgage_term_years = st.number_input("Mortgage Term (years)", value=35, step=1, min_value=1, max_value=40)
@@ -283,28 +172,53 @@ with tab_simulation:
     annual_rent_inflation_rate_input = st.number_input("Annual Rent Inflation Rate (%)", 
                                                        min_value=0.0, max_value=20.0, value=3.0, step=0.5)
     annual_rent_inflation_rate = annual_rent_inflation_rate_input / 100
+    
+    st.markdown("---")
+    st.header("Stress Test: Investment Return Uncertainty")
+    invest_return_std_input = st.number_input("Investment Return Volatility (%)", 
+                                              min_value=0.0, max_value=20.0, value=0.0, step=0.5)
+    invest_return_std = invest_return_std_input / 100
+    n_paths = st.number_input("Number of Paths", value=1000, step=100, min_value=100, max_value=10000)
 
+    # The inputs of the last simulation are kept in session state, so its results stay on screen when
+    # another widget triggers a rerun. They are only replaced when Simulate is clicked again.
     if st.button("Simulate"):
-        stop_month_buy, final_portfolio_buy, history_buy = simulate_buy_scenario(
-            initial_savings, monthly_income, monthly_expenses,
-            annual_income_growth, annual_inflation_rate, annual_invest_return,
-            property_price, mortgage_term_years, mortgage_interest_rate, deposit_fraction,
-            owner_cost_initial, annual_owner_cost_inflation, annual_house_price_growth,
-            max_months=480
+        if initial_savings < deposit_fraction * property_price:
+            st.session_state.pop("simulation_inputs", None)
+            st.error("For the buying scenario, initial savings are less than the required deposit.")
+            st.stop()
+        
+        st.session_state["simulation_inputs"] = (
+            dict(initial_savings=initial_savings, monthly_income=monthly_income, monthly_expenses=monthly_expenses,
+                 annual_income_growth=annual_income_growth, annual_inflation_rate=annual_inflation_rate,
+                 annual_invest_return=annual_invest_return,
+                 property_price=property_price, mortgage_term_years=mortgage_term_years,
+                 mortgage_interest_rate=mortgage_interest_rate, deposit_fraction=deposit_fraction,
+                 owner_cost_initial=owner_cost_initial, annual_owner_cost_inflation=annual_owner_cost_inflation,
+                 annual_house_price_growth=annual_house_price_growth,
+                 monthly_rent=monthly_rent, annual_rent_inflation_rate=annual_rent_inflation_rate),
+            dict(invest_return_std=invest_return_std, n_paths=n_paths)
         )
-        stop_month_rent, final_portfolio_rent, history_rent = simulate_rent_scenario(
-            initial_savings, monthly_income, monthly_expenses,
-            annual_income_growth, annual_inflation_rate, annual_invest_return,
-            property_price, monthly_rent, annual_rent_inflation_rate, annual_house_price_growth,
-            max_months=480
+
+    if "simulation_inputs" in st.session_state:
+        scenario_inputs, stress_test_inputs = st.session_state["simulation_inputs"]
+        
+        # Both calls are cached, so a rerun with unchanged inputs does not simulate again.
+        (stop_month_buy, final_portfolio_buy, history_buy), (stop_month_rent, final_portfolio_rent, history_rent) = simulate_both(
+            **scenario_inputs, max_months=480
         )
+        bands_buy = bands_rent = None
+        if stress_test_inputs["invest_return_std"] > 0:
+            bands_buy, bands_rent = simulate_invest_return_bands(
+                **scenario_inputs, **stress_test_inputs, max_months=480
+            )
         
         st.header("Results")
         if stop_month_buy is not None:
             st.subheader("Scenario 1: Buying with a Mortgage")
             st.write("Homeownership achieved after:", format_duration(stop_month_buy))
             st.write("Cumulative amount spent:",
-                     "£{:,.2f}".format(history_buy["cumulative_spent"][stop_month_buy]))
+                     "£{:,.2f}".format(history_buy.cumulative_spent[stop_month_buy]))
         else:
             st.subheader("Scenario 1: Buying with a Mortgage")
             st.write("Homeownership was not achieved within the simulation horizon.")
@@ -313,7 +227,7 @@ with tab_simulation:
             st.subheader("Scenario 2: Renting")
             st.write("Homeownership achieved after:", format_duration(stop_month_rent))
             st.write("Cumulative amount spent:",
-                     "£{:,.2f}".format(history_rent["cumulative_spent"][stop_month_rent]))
+                     "£{:,.2f}".format(history_rent.cumulative_spent[stop_month_rent]))
         else:
             st.subheader("Scenario 2: Renting")
             st.write("Homeownership was not achieved within the simulation horizon.")
@@ -321,59 +235,108 @@ with tab_simulation:
         # -------------------------------
         # Plotting the History with Highlighted Regions
         # -------------------------------
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        months = np.array(history_buy["months"])
-        buy_cum_spent = np.array(history_buy["cumulative_spent"])
-        rent_cum_spent = np.array(history_rent["cumulative_spent"])
-
-        # Plot cumulative spent curves
-        ax.plot(months, buy_cum_spent, label="Buy: Cumulative Spent", color="green", linestyle="--")
-        ax.plot(months, rent_cum_spent, label="Rent: Cumulative Spent", color="red", linestyle="--")
+        months = history_buy.months
+        buy_cum_spent = history_buy.cumulative_spent
+        rent_cum_spent = history_rent.cumulative_spent
+        net_wealth = history_buy.net_wealth
 
         # Determine the crossover point (first month where buying cost becomes lower than renting)
-        crossover_month = None
-        for m, spent_buy, spent_rent in zip(history_buy["months"], buy_cum_spent, rent_cum_spent):
-            if spent_buy < spent_rent:
-                crossover_month = m
-                break
+        buy_cheaper = buy_cum_spent < rent_cum_spent
+        crossover_month = int(buy_cheaper.argmax()) if buy_cheaper.any() else None
+
+        # Months drawn on the chart: every CHART_STRIDE-th month, plus the last so the lines reach the edge.
+        shown = np.unique(np.r_[0:len(months):CHART_STRIDE, len(months) - 1])
+        
+        # Series are passed to the browser as long-form data and drawn client-side by Vega-Lite.
+        series = pd.DataFrame({
+            "Month": months,
+            "Buy: Cumulative Spent": buy_cum_spent,
+            "Rent: Cumulative Spent": rent_cum_spent,
+            "House Price": history_buy.house_price,
+            "Scenario 1: Equity + Investments": net_wealth,
+            "Scenario 2: Investments": history_rent.investment_portfolio,
+        }).iloc[shown].melt("Month", var_name="Series", value_name="Value")
+        series_colors, month_x, value_y, series_dash, series_tooltip = chart_template()
+        colors = dict(series_colors)
+        layers = []
 
         if crossover_month is not None:
-            # Draw vertical line at the crossover point
-            ax.axvline(crossover_month, color="black", linestyle="--", linewidth=1.5)
             # Highlight the regions: left of crossover (renting is cheaper) and right (buying is cheaper)
-            ax.axvspan(0, crossover_month, color="red", alpha=0.2, label="Renting Cheaper")
-            ax.axvspan(crossover_month, months[-1], color="green", alpha=0.2, label="Buying Cheaper")
-            ax.annotate(f"Crossover: {format_duration(crossover_month)}",
-                        (crossover_month, np.max([buy_cum_spent.max(), rent_cum_spent.max()])),
-                        textcoords="offset points", xytext=(0,20), ha="center", color="black", arrowprops=dict(arrowstyle="-", color="black", linewidth=1))
+            colors["Renting Cheaper"] = "red"
+            colors["Buying Cheaper"] = "green"
+            regions = pd.DataFrame({
+                "Series": ["Renting Cheaper", "Buying Cheaper"],
+                "Start": [0, crossover_month],
+                "End": [crossover_month, months[-1]],
+            })
+            layers.append(alt.Chart(regions).mark_rect(opacity=0.2, clip=True).encode(x="Start:Q", x2="End:Q", color="Series:N"))
+
+        # Shade the 5th-95th percentile range when the stress test is enabled.
+        if bands_buy is not None:
+            colors["Scenario 1: 5th-95th Percentile"] = "green"
+            colors["Scenario 2: 5th-95th Percentile"] = "red"
+            band_months = months[shown]
+            bands = pd.DataFrame({
+                "Month": np.concatenate((band_months, band_months)),
+                "Series": ["Scenario 1: 5th-95th Percentile"] * len(band_months) + ["Scenario 2: 5th-95th Percentile"] * len(band_months),
+                "Low": np.concatenate((bands_buy[0, shown], bands_rent[0, shown])),
+                "High": np.concatenate((bands_buy[-1, shown], bands_rent[-1, shown])),
+            })
+            layers.append(alt.Chart(bands).mark_area(opacity=0.1, clip=True).encode(
+                x="Month:Q", y="Low:Q", y2="High:Q", color="Series:N"
+            ))
 
-        # Also plot house price and additional curves for context.
-        ax.plot(months, history_buy["house_price"], label="House Price", color="blue")
-        outstanding_mortgage = property_price * (1 - deposit_fraction)
-        net_wealth = [(hp - outstanding_mortgage) + inv for hp, inv in zip(history_buy["house_price"], history_buy["investment_portfolio"])]
-        ax.plot(months, net_wealth, label="Scenario 1: Equity + Investments", color="green")
-        ax.plot(months, history_rent["investment_portfolio"], label="Scenario 2: Investments", color="red")
+        color_scale = alt.Scale(domain=list(colors), range=list(colors.values()))
+        layers.append(alt.Chart(series).mark_line(clip=True).encode(
+            x=month_x,
+            y=value_y,
+            color=alt.Color("Series:N", scale=color_scale, title=None),
+            strokeDash=series_dash,
+            tooltip=series_tooltip,
+        ))
 
-        # Annotate homeownership points if available.
+        # Mark the crossover point and the homeownership points if available. All markers share one
+        # dataset and are drawn by a fixed set of layers, however many of them there are.
+        markers = []
+        if crossover_month is not None:
+            markers.append((crossover_month, None,
+                            f"Crossover: {format_duration(crossover_month)}", "black", "crossover"))
         if stop_month_buy is not None and stop_month_buy < len(months):
-            ax.plot(stop_month_buy, net_wealth[stop_month_buy], "ko")
-            ax.annotate(f"Buy: {format_duration(stop_month_buy)}",
-                        (stop_month_buy, net_wealth[stop_month_buy]),
-                        textcoords="offset points", xytext=(0,25), ha="center", color="green", arrowprops=dict(arrowstyle="-", color="black", linewidth=1))
+            markers.append((stop_month_buy, net_wealth[stop_month_buy],
+                            f"Buy: {format_duration(stop_month_buy)}", "green", "buy"))
         if stop_month_rent is not None and stop_month_rent < len(months):
-            ax.plot(stop_month_rent, history_rent["investment_portfolio"][stop_month_rent], "ko")
-            ax.annotate(f"Rent: {format_duration(stop_month_rent)}",
-                        (stop_month_rent, history_rent["investment_portfolio"][stop_month_rent]),
-                        textcoords="offset points", xytext=(0,-25), ha="center", color="red", arrowprops=dict(arrowstyle="-", color="black", linewidth=1))
+            markers.append((stop_month_rent, history_rent.investment_portfolio[stop_month_rent],
+                            f"Rent: {format_duration(stop_month_rent)}", "red", "rent"))
+        if markers:
+            marker_chart = alt.Chart(pd.DataFrame(markers, columns=["Month", "Value", "Label", "Color", "Kind"]))
+            is_crossover = alt.datum.Kind == "crossover"
+            label = marker_chart.encode(x="Month:Q", y="Value:Q", text="Label:N", color=alt.Color("Color:N", scale=None))
+            layers += [
+                marker_chart.mark_rule(color="black", strokeDash=[6, 4], strokeWidth=1.5, clip=True).encode(
+                    x="Month:Q"
+                ).transform_filter(is_crossover),
+                marker_chart.mark_point(filled=True, color="black", size=50, clip=True).encode(
+                    x="Month:Q", y="Value:Q"
+                ).transform_filter(~is_crossover),
+                # Zooming clips every mark to the plot area, so all labels sit inside it: the crossover label
+                # at the top, to the right of its line, and the rent label stacked above the buy label, whose
+                # point is usually close by.
+                label.mark_text(dx=5, align="left", baseline="top").encode(
+                    y=alt.value(5)
+                ).transform_filter(is_crossover),
+                label.mark_text(dy=-22).transform_filter(alt.datum.Kind == "buy"),
+                label.mark_text(dy=-44).transform_filter(alt.datum.Kind == "rent"),
+            ]
 
-        ax.set_xlabel("Months")
-        ax.set_ylabel("£")
-        ax.set_title("Homeownership Comparison Over Time")
-        ax.legend()
-        ax.grid(True)
-        formatter = mticker.FuncFormatter(lambda x, pos: f'£{x:,.0f}')
-        ax.yaxis.set_major_formatter(formatter)
+        # Scroll to zoom and drag to pan along the months. Marks are clipped to the plot area so they do
+        # not spill over the axes when zoomed in.
+        chart = alt.layer(*layers).properties(
+            title="Homeownership Comparison Over Time", height=450
+        ).interactive(bind_y=False).configure_legend(
+            orient="bottom", columns=3, symbolType="stroke", symbolOpacity=1, symbolStrokeWidth=3
+        )
+        st.altair_chart(chart, use_container_width=True)
 
-        fig.tight_layout()
-        st.pyplot(fig)
+with tab_simulation:
+    simulation_tab(initial_savings, monthly_income, monthly_expenses,
+                   annual_income_growth, annual_inflation_rate, annual_invest_return, annual_house_price_growth)
@@ -0,0 +1,352 @@
+"""
+Buy vs rent simulations.
+
+Pure NumPy with no Streamlit dependency, so the numerical code can be imported, tested or compiled
+separately from the app. app.py adds result caching and the user interface on top.
+"""
+import math
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+class BuyHistory(NamedTuple):
+    """Monthly history of the buy scenario, one array per quantity."""
+    months: np.ndarray
+    house_price: np.ndarray
+    investment_portfolio: np.ndarray
+    net_wealth: np.ndarray
+    cumulative_spent: np.ndarray
+
+class RentHistory(NamedTuple):
+    """Monthly history of the rent scenario, one array per quantity."""
+    months: np.ndarray
+    house_price: np.ndarray
+    investment_portfolio: np.ndarray
+    cumulative_spent: np.ndarray
+
+# ---------------------------------------------------------------------
+# Simulation Functions
+# ---------------------------------------------------------------------
+def simulate_both(initial_savings, monthly_income, monthly_expenses,
+                  annual_income_growth, annual_inflation_rate, annual_invest_return,
+                  property_price, mortgage_term_years, mortgage_interest_rate, deposit_fraction,
+                  owner_cost_initial, annual_owner_cost_inflation, annual_house_price_growth,
+                  monthly_rent, annual_rent_inflation_rate,
+                  max_months=480, dtype=np.float64):
+    """
+    Simulate both scenarios over the same timeline in a single pass.
+    
+    Income, expenses, house price and investment growth are shared by the two scenarios, so they are
+    computed once here and handed to each scenario's core.
+    
+    Assumes initial savings cover the deposit; the caller is responsible for checking this.
+    
+    All monetary series are computed in `dtype`. The default float64 keeps cumulative totals exact to the
+    penny; float32 halves memory traffic for large batches where that precision is not needed.
+    
+    Returns:
+    - (stop_month, final_investment_portfolio, history) for buying, where history is a BuyHistory.
+    - (stop_month, final_investment_portfolio, history) for renting, where history is a RentHistory.
+    """
+    months, income, expenses, house_price, return_factors = _common_series(
+        monthly_income, monthly_expenses, property_price,
+        annual_income_growth, annual_inflation_rate, annual_invest_return, annual_house_price_growth,
+        max_months, dtype
+    )
+    
+    stop_month_buy, final_portfolio_buy, investment_portfolio_buy, net_wealth, cumulative_spent_buy = _buy_core(
+        months, income, expenses, house_price, return_factors,
+        initial_savings, property_price, mortgage_term_years, mortgage_interest_rate, deposit_fraction,
+        owner_cost_initial, annual_owner_cost_inflation
+    )
+    stop_month_rent, final_portfolio_rent, investment_portfolio_rent, cumulative_spent_rent = _rent_core(
+        months, income, expenses, house_price, return_factors,
+        initial_savings, monthly_rent, annual_rent_inflation_rate
+    )
+    
+    history_buy = BuyHistory(months, house_price, investment_portfolio_buy, net_wealth, cumulative_spent_buy)
+    history_rent = RentHistory(months, house_price, investment_portfolio_rent, cumulative_spent_rent)
+    return (stop_month_buy, final_portfolio_buy, history_buy), (stop_month_rent, final_portfolio_rent, history_rent)
+
+def simulate_invest_return_bands(initial_savings, monthly_income, monthly_expenses,
+                                 annual_income_growth, annual_inflation_rate, annual_invest_return,
+                                 property_price, mortgage_term_years, mortgage_interest_rate, deposit_fraction,
+                                 owner_cost_initial, annual_owner_cost_inflation, annual_house_price_growth,
+                                 monthly_rent, annual_rent_inflation_rate,
+                                 invest_return_std, n_paths=1000, seed=0,
+                                 percentiles=(5, 95), max_months=480, dtype=np.float32):
+    """
+    Stress test both scenarios against an uncertain investment return.
+    
+    Draws n_paths annual investment returns from a normal distribution with mean annual_invest_return and
+    standard deviation invest_return_std, each held for the whole horizon. All paths are simulated at once
+    by broadcasting along a leading path axis, so the cost is close to that of a single simulation.
+    
+    The paths default to float32: the (n_paths, max_months) arrays dominate the memory traffic, and the
+    bands are only plotted, so they need nowhere near penny precision.
+    
+    Returns float32 percentile bands, each of shape (len(percentiles), max_months), for:
+    - the buy scenario's equity + investments
+    - the rent scenario's investments
+    """
+    rng = np.random.default_rng(seed)
+    # Returns below -100% a year are meaningless, so clip the tail of the distribution.
+    annual_invest_returns = np.maximum(rng.normal(annual_invest_return, invest_return_std, n_paths), -0.99)
+    
+    # Only the return factors carry the path axis.
+    months, income, expenses, house_price, return_factors = _common_series(
+        monthly_income, monthly_expenses, property_price,
+        annual_income_growth, annual_inflation_rate, annual_invest_returns[:, None], annual_house_price_growth,
+        max_months, dtype
+    )
+    
+    _, _, _, net_wealth, _ = _buy_core(
+        months, income, expenses, house_price, return_factors,
+        initial_savings, property_price, mortgage_term_years, mortgage_interest_rate, deposit_fraction,
+        owner_cost_initial, annual_owner_cost_inflation
+    )
+    _, _, investment_portfolio_rent, _ = _rent_core(
+        months, income, expenses, house_price, return_factors,
+        initial_savings, monthly_rent, annual_rent_inflation_rate
+    )
+    
+    # The bands are only plotted, so they are stored (and cached) in float32 whatever the path dtype.
+    return (np.percentile(net_wealth, percentiles, axis=0).astype(np.float32),
+            np.percentile(investment_portfolio_rent, percentiles, axis=0).astype(np.float32))
+
+def simulate_buy_grid(initial_savings, monthly_income, monthly_expenses,
+                      annual_income_growth, annual_inflation_rate, annual_invest_return,
+                      property_price, mortgage_term_years, mortgage_interest_rate, deposit_fraction,
+                      owner_cost_initial, annual_owner_cost_inflation, annual_house_price_growth,
+                      max_months=480):
+    """
+    Simulate the buy scenario for many parameter combinations at once, e.g. an interest rate x house
+    price growth sweep.
+    
+    Any argument except max_months may be a 1-D array. The arguments are broadcast against each other to
+    give n scenarios (pass np.meshgrid(...) outputs, raveled, for a full grid), and every scenario is
+    simulated in the same vectorised pass with the scenario along a leading axis.
+    
+    Assumes initial savings cover the deposit in every scenario.
+    
+    Returns:
+    - stop_months: integer array of shape (n,), with -1 where homeownership is not achieved
+    - history: a BuyHistory whose months have shape (max_months,) and whose other arrays have shape
+      (n, max_months)
+    """
+    params = np.broadcast_arrays(*(np.atleast_1d(param) for param in (
+        initial_savings, monthly_income, monthly_expenses,
+        annual_income_growth, annual_inflation_rate, annual_invest_return,
+        property_price, mortgage_term_years, mortgage_interest_rate, deposit_fraction,
+        owner_cost_initial, annual_owner_cost_inflation, annual_house_price_growth
+    )))
+    # A trailing axis of length 1 lets each scenario's parameters broadcast along its months.
+    (initial_savings, monthly_income, monthly_expenses,
+     annual_income_growth, annual_inflation_rate, annual_invest_return,
+     property_price, mortgage_term_years, mortgage_interest_rate, deposit_fraction,
+     owner_cost_initial, annual_owner_cost_inflation, annual_house_price_growth) = (param[:, None] for param in params)
+    
+    months, income, expenses, house_price, return_factors = _common_series(
+        monthly_income, monthly_expenses, property_price,
+        annual_income_growth, annual_inflation_rate, annual_invest_return, annual_house_price_growth,
+        max_months
+    )
+    
+    stop_months, _, investment_portfolio, net_wealth, cumulative_spent = _buy_core(
+        months, income, expenses, house_price, return_factors,
+        initial_savings, property_price, mortgage_term_years, mortgage_interest_rate, deposit_fraction,
+        owner_cost_initial, annual_owner_cost_inflation
+    )
+    
+    return stop_months, BuyHistory(months, house_price, investment_portfolio, net_wealth, cumulative_spent)
+
+def _common_series(monthly_income, monthly_expenses, property_price,
+                   annual_income_growth, annual_inflation_rate, annual_invest_return, annual_house_price_growth,
+                   max_months, dtype=np.float64):
+    """
+    Monthly series shared by the buy and rent scenarios, evaluated for every month at once rather than
+    updated in a loop.
+    
+    Returns months, income, expenses, house_price and return_factors. The return factors run one month
+    longer than the rest, so the final (post-update) portfolio is available. They are float64 whatever
+    `dtype` is: for strongly negative returns they fall below float32's range over the horizon, and the
+    portfolio divides by them.
+    """
+    # Monthly multipliers
+    mi_growth = _monthly_multiplier(annual_income_growth)
+    me_growth = _monthly_multiplier(annual_inflation_rate)
+    mi_return = _monthly_multiplier(annual_invest_return)
+    mhp_growth = _monthly_multiplier(annual_house_price_growth)
+    
+    months = np.arange(max_months)
+    income = _geometric_series(monthly_income, mi_growth, max_months, dtype)
+    expenses = _geometric_series(monthly_expenses, me_growth, max_months, dtype)
+    house_price = _geometric_series(property_price, mhp_growth, max_months, dtype)
+    return_factors = _geometric_series(1.0, mi_return, max_months + 1)
+    return months, income, expenses, house_price, return_factors
+
+def _monthly_multiplier(annual_rate):
+    """
+    Monthly growth factor equivalent to an annual rate, i.e. (1 + annual_rate) ** (1 / 12).
+    
+    Scalar rates are memoised; arrays of rates are evaluated element-wise.
+    """
+    if np.ndim(annual_rate):
+        return (1 + np.asarray(annual_rate)) ** (1 / 12)
+    return _scalar_monthly_multiplier(annual_rate)
+
+@lru_cache(maxsize=1024)
+def _scalar_monthly_multiplier(annual_rate):
+    return math.pow(1.0 + annual_rate, 1.0 / 12.0)
+
+def _geometric_series(start, ratio, length, dtype=np.float64):
+    """
+    Returns [start, start * ratio, start * ratio**2, ...] with the given length.
+    
+    Evaluated as exp(month * log(ratio)), which NumPy vectorises with SIMD, unlike a cumulative product
+    whose every step waits on the previous one. It is also more accurate, as rounding errors do not
+    compound from month to month.
+    
+    `start` and `ratio` may also be batches of shape (n, 1), giving one series per row.
+    """
+    return start * np.exp(np.arange(length, dtype=dtype) * np.log(ratio, dtype=dtype))
+
+def _exclusive_cumsum(values):
+    """
+    Running totals before each element: [0, v0, v0 + v1, ..., sum(values)], one longer than values
+    along the last axis and in the same dtype.
+    
+    The sum is always accumulated in float64, so float32 inputs do not drift over long horizons.
+    """
+    totals = np.zeros(values.shape[:-1] + (values.shape[-1] + 1,), dtype=values.dtype)
+    totals[..., 1:] = np.cumsum(values, axis=-1, dtype=np.float64)
+    return totals
+
+def _first_month(mask):
+    """
+    First month where mask holds, or None if it never does. For a batch of paths (months on the last
+    axis) returns an int array holding -1 where the mask never holds.
+    """
+    found = mask.any(axis=-1)
+    first = mask.argmax(axis=-1)
+    if mask.ndim == 1:
+        return int(first) if found else None
+    return np.where(found, first, -1)
+
+def _portfolio_path(initial_portfolio, monthly_disposable, return_factors):
+    """
+    Closed form of portfolio[n + 1] = portfolio[n] * mi_return + monthly_disposable[n]:
+    portfolio[n] = mi_return**n * (initial_portfolio + sum_{k<n} monthly_disposable[k] / mi_return**(k + 1))
+    
+    Returns the portfolio at the start of every month plus the final (post-update) value. Months run along
+    the last axis, so return_factors may carry a leading axis of investment return paths.
+    
+    The discounting is done in the precision of return_factors, and only the result is cast back to the
+    dtype of monthly_disposable.
+    """
+    discounted_contributions = _exclusive_cumsum(monthly_disposable / return_factors[..., 1:])
+    portfolio = return_factors * (initial_portfolio + discounted_contributions)
+    return portfolio.astype(monthly_disposable.dtype, copy=False)
+
+def _buy_core(months, income, expenses, house_price, return_factors,
+              initial_savings, property_price, mortgage_term_years, mortgage_interest_rate, deposit_fraction,
+              owner_cost_initial, annual_owner_cost_inflation):
+    """
+    Scenario 1: Buy a property now using a mortgage.
+    
+    Simulation Mechanics:
+    1. At time zero, you pay the deposit and finance the remaining amount with a mortgage.
+    2. Every month:
+       - Update income, expenses, and owner costs using growth/inflation rates.
+       - The property price grows using the annual house price growth.
+       - Pay the monthly mortgage repayment (interest plus principal, amortized over the term) and owner costs.
+       - Add any positive disposable income to your investment portfolio (which grows at the monthly investment rate).
+    3. Homeownership is deemed achieved when the investment portfolio meets or exceeds the outstanding mortgage.
+    
+    Additionally, this function tracks the cumulative amount spent on housing:
+      - For buying: deposit + interest payments + owner occupier housing costs.
+    
+    Returns stop_month (or None), the final portfolio and the monthly arrays: investment_portfolio,
+    net_wealth and cumulative_spent.
+    """
+    m_interest = mortgage_interest_rate / 12
+    moc_growth = _monthly_multiplier(annual_owner_cost_inflation)
+    
+    deposit_amount = deposit_fraction * property_price
+    
+    # Investment portfolio starts after paying the deposit.
+    initial_portfolio = initial_savings - deposit_amount
+    initial_mortgage = property_price * (1 - deposit_fraction)
+    
+    # Repayment mortgage: a fixed monthly payment over the term, with the remaining balance in closed form
+    # balance[i] = B * ((1 + r)**n - (1 + r)**i) / ((1 + r)**n - 1), which tends to B * (n - i) / n as r -> 0,
+    # and nothing owed once the term has ended.
+    # Written with np.where rather than an if on the rate so that a batch may mix zero and non-zero rates.
+    term_months = np.trunc(np.multiply(mortgage_term_years, 12))
+    in_term = months < term_months
+    has_interest = m_interest > 0
+    interest_growth = _geometric_series(1.0, 1 + m_interest, len(months), income.dtype)
+    term_growth = (1 + m_interest) ** term_months
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mortgage_payment = np.where(has_interest,
+                                    initial_mortgage * m_interest * term_growth / (term_growth - 1),
+                                    initial_mortgage / term_months)
+        balance = np.where(has_interest,
+                           initial_mortgage * (term_growth - interest_growth) / (term_growth - 1),
+                           initial_mortgage * (term_months - months) / term_months)
+    outstanding_mortgage = np.where(in_term, balance, 0.0).astype(income.dtype)
+    payment = np.where(in_term, mortgage_payment, 0.0).astype(income.dtype)
+    interest_payment = outstanding_mortgage * m_interest
+    
+    owner_cost = _geometric_series(owner_cost_initial, moc_growth, len(months), income.dtype)
+    monthly_disposable = np.maximum(income - expenses - payment - owner_cost, 0.0)
+    
+    portfolio = _portfolio_path(initial_portfolio, monthly_disposable, return_factors)
+    investment_portfolio = portfolio[..., :-1]
+    
+    # Cumulative spent starts with the deposit, then adds each month's interest and owner cost.
+    # Principal repayments are not counted as spending since they become equity.
+    monthly_spent = interest_payment + owner_cost
+    cumulative_spent = deposit_amount + _exclusive_cumsum(monthly_spent)[..., :-1]
+    
+    equity = house_price - outstanding_mortgage
+    net_wealth = equity + investment_portfolio
+    
+    # Homeownership is achieved in the first month the portfolio covers the mortgage
+    stop_month = _first_month(investment_portfolio >= outstanding_mortgage)
+    
+    return stop_month, np.take(portfolio, -1, axis=-1), investment_portfolio, net_wealth, cumulative_spent
+
+def _rent_core(months, income, expenses, house_price, return_factors,
+               initial_savings, monthly_rent, annual_rent_inflation_rate):
+    """
+    Scenario 2: Rent now and purchase for cash later.
+    
+    Simulation Mechanics:
+    1. All initial savings are invested.
+    2. Every month:
+         - Update income, expenses, and rent using their respective growth/inflation multipliers.
+         - The property price grows according to the annual house price growth.
+         - Add any positive disposable income to your investment portfolio.
+    3. Homeownership is met when the investment portfolio reaches or exceeds the current property price.
+    
+    Additionally, this function tracks the cumulative amount spent on rent.
+    
+    Returns stop_month (or None), the final portfolio and the monthly arrays: investment_portfolio
+    and cumulative_spent.
+    """
+    mr_growth = _monthly_multiplier(annual_rent_inflation_rate)
+    
+    rent = _geometric_series(monthly_rent, mr_growth, len(months), income.dtype)
+    monthly_disposable = np.maximum(income - expenses - rent, 0.0)
+    
+    portfolio = _portfolio_path(initial_savings, monthly_disposable, return_factors)
+    investment_portfolio = portfolio[..., :-1]
+    
+    # Cumulative spent on rent.
+    cumulative_spent = _exclusive_cumsum(rent)[..., :-1]
+    
+    stop_month = _first_month(investment_portfolio >= house_price)
+    
+    return stop_month, np.take(portfolio, -1, axis=-1), investment_portfolio, cumulative_spent
@@ -0,0 +1,156 @@
+"""
+Regression tests for the vectorised simulations against a plain month-by-month reference loop.
+
+Run from the repository root with: python -m unittest discover tests
+"""
+import unittest
+
+import numpy as np
+
+import simulations
+
+# Default inputs of the app
+DEFAULTS = dict(
+    initial_savings=73000.0, monthly_income=6500.0, monthly_expenses=3000.0,
+    annual_income_growth=0.03, annual_inflation_rate=0.02, annual_invest_return=0.05,
+    property_price=430000.0, mortgage_term_years=35, mortgage_interest_rate=0.045, deposit_fraction=0.1,
+    owner_cost_initial=200.0, annual_owner_cost_inflation=0.05, annual_house_price_growth=0.02,
+    monthly_rent=1995.0, annual_rent_inflation_rate=0.03,
+)
+
+CASES = {
+    "defaults": {},
+    "zero mortgage rate": dict(mortgage_interest_rate=0.0),
+    # Expenses plus mortgage payment exceed income at first, so disposable income clamps to zero
+    "clamped disposable income": dict(monthly_income=3000.0),
+    "short term": dict(mortgage_term_years=5),
+}
+
+def reference_buy(initial_savings, monthly_income, monthly_expenses,
+                  annual_income_growth, annual_inflation_rate, annual_invest_return,
+                  property_price, mortgage_term_years, mortgage_interest_rate, deposit_fraction,
+                  owner_cost_initial, annual_owner_cost_inflation, annual_house_price_growth,
+                  max_months=480, **_):
+    """
+    Buy scenario as a per-month loop: returns stop_month (or None), the final portfolio and a dictionary of
+    lists with "investment_portfolio", "net_wealth" and "cumulative_spent".
+    """
+    m_interest = mortgage_interest_rate / 12
+    term_months = int(mortgage_term_years * 12)
+    deposit_amount = deposit_fraction * property_price
+    investment_portfolio = initial_savings - deposit_amount
+    outstanding_mortgage = property_price * (1 - deposit_fraction)
+    if m_interest > 0:
+        mortgage_payment = outstanding_mortgage * m_interest / (1 - (1 + m_interest) ** -term_months)
+    else:
+        mortgage_payment = outstanding_mortgage / term_months
+
+    current_income = monthly_income
+    current_expenses = monthly_expenses
+    current_owner_cost = owner_cost_initial
+    current_house_price = property_price
+    cumulative_spent = deposit_amount
+    stop_month = None
+    history = {"investment_portfolio": [], "net_wealth": [], "cumulative_spent": []}
+
+    for month in range(max_months):
+        if month >= term_months:
+            outstanding_mortgage = 0.0
+        history["investment_portfolio"].append(investment_portfolio)
+        history["net_wealth"].append(current_house_price - outstanding_mortgage + investment_portfolio)
+        history["cumulative_spent"].append(cumulative_spent)
+        if stop_month is None and investment_portfolio >= outstanding_mortgage:
+            stop_month = month
+
+        interest_payment = outstanding_mortgage * m_interest
+        payment = mortgage_payment if month < term_months else 0.0
+        disposable = max(current_income - current_expenses - payment - current_owner_cost, 0.0)
+        cumulative_spent += interest_payment + current_owner_cost
+        investment_portfolio = investment_portfolio * (1 + annual_invest_return) ** (1 / 12) + disposable
+        outstanding_mortgage += interest_payment - payment
+
+        current_income *= (1 + annual_income_growth) ** (1 / 12)
+        current_expenses *= (1 + annual_inflation_rate) ** (1 / 12)
+        current_owner_cost *= (1 + annual_owner_cost_inflation) ** (1 / 12)
+        current_house_price *= (1 + annual_house_price_growth) ** (1 / 12)
+
+    return stop_month, investment_portfolio, history
+
+def reference_rent(initial_savings, monthly_income, monthly_expenses,
+                   annual_income_growth, annual_inflation_rate, annual_invest_return,
+                   property_price, annual_house_price_growth, monthly_rent, annual_rent_inflation_rate,
+                   max_months=480, **_):
+    """
+    Rent scenario as a per-month loop: returns stop_month (or None), the final portfolio and a dictionary of
+    lists with "investment_portfolio" and "cumulative_spent".
+    """
+    investment_portfolio = initial_savings
+    current_income = monthly_income
+    current_expenses = monthly_expenses
+    current_rent = monthly_rent
+    current_house_price = property_price
+    cumulative_spent = 0.0
+    stop_month = None
+    history = {"investment_portfolio": [], "cumulative_spent": []}
+
+    for month in range(max_months):
+        history["investment_portfolio"].append(investment_portfolio)
+        history["cumulative_spent"].append(cumulative_spent)
+        if stop_month is None and investment_portfolio >= current_house_price:
+            stop_month = month
+
+        disposable = max(current_income - current_expenses - current_rent, 0.0)
+        cumulative_spent += current_rent
+        investment_portfolio = investment_portfolio * (1 + annual_invest_return) ** (1 / 12) + disposable
+
+        current_income *= (1 + annual_income_growth) ** (1 / 12)
+        current_expenses *= (1 + annual_inflation_rate) ** (1 / 12)
+        current_rent *= (1 + annual_rent_inflation_rate) ** (1 / 12)
+        current_house_price *= (1 + annual_house_price_growth) ** (1 / 12)
+
+    return stop_month, investment_portfolio, history
+
+class SimulateBothTest(unittest.TestCase):
+    def assert_matches(self, result, reference):
+        stop_month, final_portfolio, history = result
+        ref_stop_month, ref_final_portfolio, ref_history = reference
+        self.assertEqual(stop_month, ref_stop_month)
+        np.testing.assert_allclose(final_portfolio, ref_final_portfolio, rtol=1e-9)
+        for name, values in ref_history.items():
+            np.testing.assert_allclose(getattr(history, name), values, rtol=1e-9, atol=1e-6, err_msg=name)
+        if stop_month is not None:
+            self.assertAlmostEqual(history.cumulative_spent[stop_month], ref_history["cumulative_spent"][stop_month],
+                                   places=6)
+
+    def test_matches_reference_loop(self):
+        for name, overrides in CASES.items():
+            inputs = {**DEFAULTS, **overrides}
+            with self.subTest(name):
+                buy, rent = simulations.simulate_both(**inputs)
+                self.assert_matches(buy, reference_buy(**inputs))
+                self.assert_matches(rent, reference_rent(**inputs))
+
+class SimulateBuyGridTest(unittest.TestCase):
+    def test_matches_single_scenarios(self):
+        # Interest rate x house price growth sweep, including a zero rate, with terms varying by scenario
+        rates, growths = np.meshgrid([0.0, 0.03, 0.06], [0.0, 0.02, 0.05])
+        terms = np.tile([25, 35, 35], 3)
+        inputs = {name: value for name, value in DEFAULTS.items()
+                  if name not in ("monthly_rent", "annual_rent_inflation_rate")}
+        stop_months, history = simulations.simulate_buy_grid(**{
+            **inputs, "mortgage_interest_rate": rates.ravel(), "annual_house_price_growth": growths.ravel(),
+            "mortgage_term_years": terms
+        })
+        for i, (rate, growth, term) in enumerate(zip(rates.ravel(), growths.ravel(), terms)):
+            with self.subTest(rate=rate, growth=growth, term=term):
+                (stop_month, _, single), _ = simulations.simulate_both(**{
+                    **DEFAULTS, "mortgage_interest_rate": rate, "annual_house_price_growth": growth,
+                    "mortgage_term_years": term
+                })
+                self.assertEqual(stop_months[i], -1 if stop_month is None else stop_month)
+                for name in ("house_price", "investment_portfolio", "net_wealth", "cumulative_spent"):
+                    np.testing.assert_allclose(getattr(history, name)[i], getattr(single, name), rtol=1e-9,
+                                               err_msg=name)
+
+if __name__ == "__main__":
+    unittest.main()